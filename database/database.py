@@ -1,17 +1,37 @@
+from neo4j import GraphDatabase
 from neomodel import config, db
+from models.models import (
+    Document, User, Folder, Session,
+    FileMetadata, Version, Classifier,
+    ClassifierData, Enricher, BGSClassification, UserEdit
+)
 import os
 from dotenv import load_dotenv
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Models whose labels, constraints and indexes are installed on startup
+OGM_MODELS = (
+    Document, User, Folder, Session,
+    FileMetadata, Version, Classifier,
+    ClassifierData, Enricher, BGSClassification, UserEdit
+)
+
+# Successful health checks are reused for this many seconds
+HEALTH_CHECK_CACHE_SECONDS = 1.0
+
 
 class Neo4jOGMConnection:
     """Neo4j OGM Database connection wrapper"""
     
     def __init__(self):
         self.database = None
+        self.driver = None
+        self._last_ok_ts = 0.0
         self.connect()
     
     def connect(self):
@@ -21,11 +41,28 @@ class Neo4jOGMConnection:
             username = os.getenv("NEO4J_USERNAME", "neo4j")
             password = os.getenv("NEO4J_PASSWORD", "password")
             
-            # Configure neomodel
-            config.DATABASE_URL = f"bolt://{username}:{password}@{uri.replace('neo4j://', '').replace('bolt://', '')}"
+            # Build one explicitly sized driver pool, for
+            # (uvicorn workers x per-worker concurrency)
+            self.driver = GraphDatabase.driver(
+                f"bolt://{uri.replace('neo4j://', '').replace('bolt://', '')}",
+                auth=(username, password),
+                max_connection_pool_size=int(os.getenv("NEO4J_MAX_POOL", "50")),
+                connection_acquisition_timeout=float(os.getenv("NEO4J_ACQ_TIMEOUT", "30")),
+                max_connection_lifetime=int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")),
+                keep_alive=True
+            )
+            
+            # neomodel's db is thread-local and each new thread connects from
+            # config, trying DATABASE_URL before DRIVER. Clearing the (truthy)
+            # default URL makes threadpool workers reuse this driver instead of
+            # building their own against the default address
+            config.DATABASE_URL = ""
+            config.DRIVER = self.driver
+            db.set_connection(driver=self.driver)
             
             # Test the connection
-            db.cypher_query("RETURN 1")
+            self.driver.verify_connectivity()
+            self._last_ok_ts = time.monotonic()
             
             logger.info("Neo4j OGM connection initialized with neomodel")
         except Exception as e:
@@ -35,18 +72,48 @@ class Neo4jOGMConnection:
     def install_all_labels(self):
         """Install all model labels and constraints"""
         try:
-            # Import models to ensure they are registered
-            from models.models import Document, User, Folder, Session, FileMetadata, Version
-            
-            # Install model labels and constraints
-            from neomodel import install_all_labels
-            install_all_labels()
+            # Schema DDL runs one model at a time on this thread's connection;
+            # concurrent schema transactions only contend for locks
+            for model in OGM_MODELS:
+                db.install_labels(model)
             
             logger.info("OGM models and constraints installed successfully")
         except Exception as e:
             logger.error(f"Error installing labels: {str(e)}")
             raise
     
+    def health_check(self) -> bool:
+        """Check connectivity, reusing a recent successful check"""
+        now = time.monotonic()
+        if now - self._last_ok_ts < HEALTH_CHECK_CACHE_SECONDS:
+            return True
+        
+        # Pings a pooled connection without opening a session
+        self.driver.verify_connectivity()
+        self._last_ok_ts = now
+        return True
+    
+    def warm_pool(self, size: int):
+        """Open pooled connections up front so early requests skip the handshake"""
+        try:
+            # Concurrent queries each hold a distinct connection, growing the pool
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                list(executor.map(lambda _: self.driver.execute_query("RETURN 1"), range(size)))
+            
+            logger.info(f"Warmed up {size} pooled connections")
+        except Exception as e:
+            logger.warning(f"Error warming up connection pool: {str(e)}")
+    
+    def warm_up(self, queries):
+        """Populate Neo4j's query plan cache without executing the queries"""
+        for query, params in queries:
+            try:
+                db.cypher_query(f"EXPLAIN {query}", params)
+            except Exception as e:
+                logger.warning(f"Error warming up query plan: {str(e)}")
+        
+        logger.info(f"Warmed up {len(queries)} query plans")
+    
     def get_database(self):
         """Get the database instance"""
         return db
@@ -54,7 +121,7 @@ class Neo4jOGMConnection:
     def close(self):
         """Close the database connection"""
         try:
-            # neomodel handles connection pooling automatically
+            self.driver.close()
             logger.info("Neo4j OGM connection closed")
         except Exception as e:
             logger.error(f"Error closing connection: {str(e)}")
@@ -1,11 +1,22 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from anyio import to_thread
+from contextlib import asynccontextmanager
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Optional, List, FrozenSet
 from dotenv import load_dotenv
 import os
+import re
 import logging
+from neo4j.exceptions import ConstraintError, ServiceUnavailable, SessionExpired, TransientError
 from database.database import database, db_connection
-from services.services import DocumentService, UserService, SessionService, ClassifierService
+from services.services import (
+    DocumentService, UserService, SessionService, ClassifierService,
+    FolderService, EnricherService, BulkWriteError
+)
+from services.queries import WARMUP_QUERIES
+from neomodel.exceptions import ConstraintValidationFailed
 from data.data import parameters
 
 # Configure logging
@@ -13,24 +24,177 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 load_dotenv()
-app = FastAPI()
 
-@app.on_event("startup")
-async def startup_event():
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     try:
+        # Sync endpoints run in this threadpool; size it to the Neo4j pool
+        to_thread.current_default_thread_limiter().total_tokens = int(os.getenv("API_THREADPOOL_SIZE", "50"))
+        
         # Initialize the database connection
-        database.install_all_labels()
+        db_connection.install_all_labels()
+        db_connection.warm_pool(int(os.getenv("NEO4J_POOL_WARMUP", "10")))
+        db_connection.warm_up(WARMUP_QUERIES)
         logger.info("Neo4j OGM models initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing OGM models: {str(e)}")
         raise
+    
+    yield
+    
+    # Release the driver and its pooled connections
+    db_connection.close()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# List pages repeat the same keys on every row and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+class ClassifierCreate(BaseModel):
+    """Request body for creating a classifier"""
+    uid: str
+    name: str
+    isHierarchy: bool
+    parentId: Optional[str] = None
+    prompt: str
+    description: str
+
+
+class FolderCreate(BaseModel):
+    """Request body for creating a folder"""
+    uid: str
+    name: str
+    path: str
+    driveType: str
+    driveId: str
+    siteId: str
+
+
+class EnricherCreate(BaseModel):
+    """Request body for creating an enricher"""
+    name: str
+    searchTerm: str
+    body: str
+    active: bool
+    value: Optional[str] = None
+
+
+class DocumentStructureIn(BaseModel):
+    """Request body for creating a document with its related nodes, in the flat /data shape"""
+    id: str
+    name: str
+    label: str
+    size: int
+    file_name: Optional[str] = None
+    source: str
+    type: str
+    createdDateTime: str
+    lastModifiedDateTime: str
+    webUrl: str
+    downloadUrl: str
+    driveId: str
+    siteId: str
+    status: str
+    description: Optional[str] = None
+    version: str
+    createdBy_id: str
+    createdBy_email: str
+    createdBy_displayName: str
+    lastModifiedBy_id: str
+    lastModifiedBy_email: str
+    lastModifiedBy_displayName: str
+    parentReference_id: str
+    parentReference_name: str
+    parentReference_path: str
+    parentReference_driveType: str
+    parentReference_driveId: str
+    parentReference_siteId: str
+    sessionId: str
+    sessionName: str
+    session_createdAt: str
+    session_createdBy: str
+    session_fileCount: int
+    session_completedAt: Optional[str] = None
+    session_status: str
+    session_warnings: int
+    session_rowCount: int
+    file_documentId: str
+    file_mimeType: str
+    file_quickXorHash: str
+    file_sharedScope: str
+    file_createdDateTime: str
+    file_lastModifiedDateTime: str
+    version_documentId: str
+    version_eTag: str
+    version_cTag: str
+    version_timestamp: str
+    version_versionNumber: int
+
+
+# Dump a whole batch in one call to pydantic-core
+_CLASSIFIER_LIST_ADAPTER = TypeAdapter(List[ClassifierCreate])
+_FOLDER_LIST_ADAPTER = TypeAdapter(List[FolderCreate])
+_ENRICHER_LIST_ADAPTER = TypeAdapter(List[EnricherCreate])
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentStructureIn])
+
+
+def _error_status(e: Exception) -> int:
+    """Map an endpoint error to an HTTP status code"""
+    if isinstance(e, BulkWriteError):
+        # Report the batch that failed, not the wrapper
+        e = e.__cause__
+    if isinstance(e, (ConstraintError, ConstraintValidationFailed)):
+        return 409
+    if isinstance(e, (ServiceUnavailable, SessionExpired, TransientError)):
+        # Retryable on the client side; the database is busy or unreachable
+        return 503
+    if isinstance(e, ValueError):
+        # Bad input, such as a malformed pagination cursor
+        return 400
+    # Cypher syntax errors, other Neo4j errors and plain bugs are server faults
+    logger.error(f"Unexpected server error: {str(e)}", exc_info=e)
+    return 500
+
+
+# Entity tags in an If-None-Match list; commas may appear inside quoted tags
+_ENTITY_TAG = re.compile(r'(?:W/)?"([^"]*)"')
+
+
+def _parse_if_none_match(header: Optional[str]) -> FrozenSet[str]:
+    """Parse If-None-Match into unquoted tags, dropping weak prefixes"""
+    if not header:
+        return frozenset()
+    header = header.strip()
+    if header == "*":
+        return frozenset(("*",))
+    tags = _ENTITY_TAG.findall(header)
+    # Tolerate clients that echo a bare, unquoted tag
+    return frozenset(tags) if tags else frozenset((header.removeprefix("W/"),))
+
+
+def _quote_etag(etag: str) -> str:
+    """Format a stored eTag as a quoted entity tag"""
+    return '"' + etag.strip('"') + '"'
+
 
 @app.get("/")
 async def root():
     return {"message": "Hello, World!"}
 
+@app.get("/health")
+def health_check():
+    """Report Neo4j connectivity for liveness/readiness probes"""
+    try:
+        db_connection.health_check()
+        return {"status": "healthy"}
+    except Exception as e:
+        logger.error(f"Health check failed: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {str(e)}")
+
 @app.post("/data")
-async def insert_data():
+def insert_data():
     """Insert all data with complete schema using OGM"""
     try:
         logger.info("Starting complete data insertion")
@@ -43,32 +207,41 @@ async def insert_data():
             
     except Exception as e:
         logger.error(f"Error inserting data: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error inserting data: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error inserting data: {str(e)}")
 
 @app.get("/export/document/{document_id}")
-async def export_document(document_id: str):
+def export_document(document_id: str, request: Request):
     """Export document with complete data structure using OGM"""
     try:
         logger.info(f"Exporting document: {document_id}")
         
-        response = DocumentService.get_document_with_relations(document_id)
+        etag, response = DocumentService.get_document_export(
+            document_id, _parse_if_none_match(request.headers.get("if-none-match"))
+        )
+        
+        # Short-circuit repeat pollers whose copy is still current
+        if etag and not response:
+            logger.info(f"Document not modified: {document_id}")
+            return Response(status_code=304, headers={"ETag": _quote_etag(etag)})
         
         if not response:
             logger.warning(f"Document not found: {document_id}")
             raise HTTPException(status_code=404, detail=f"Document not found: {document_id}")
         
         logger.info(f"Successfully exported document: {document_id}")
-        return response
+        # The export dict only holds JSON-native values; skip jsonable_encoder
+        headers = {"ETag": _quote_etag(response["eTag"])} if response["eTag"] else None
+        return ORJSONResponse(content=response, headers=headers)
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
         logger.error(f"Error exporting document {document_id}: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error exporting document: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error exporting document: {str(e)}")
 
 @app.delete("/data/")
-async def delete_all_data():
+def delete_all_data():
     """Delete all data from the Neo4j database using OGM"""
     try:
         logger.info("Starting data deletion")
@@ -80,19 +253,116 @@ async def delete_all_data():
         
     except Exception as e:
         logger.error(f"Error deleting data: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Error deleting data: {str(e)}")
-
-def convert_neo4j_datetime(obj):
-    """Convert Neo4j datetime objects to ISO strings"""
-    from neo4j.time import DateTime as Neo4jDateTime
-    if isinstance(obj, dict):
-        return {key: convert_neo4j_datetime(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_neo4j_datetime(item) for item in obj]
-    elif isinstance(obj, Neo4jDateTime):
-        return obj.to_native().isoformat() + 'Z' if obj.to_native() else None
-    elif hasattr(obj, '__dict__'):
-        # Handle Neo4j Node and Relationship objects
-        return convert_neo4j_datetime(dict(obj))
-    else:
-        return obj
+        raise HTTPException(status_code=_error_status(e), detail=f"Error deleting data: {str(e)}")
+
+@app.get("/classifiers")
+def list_classifiers(cursor: Optional[str] = Query(None, description="next_cursor from the previous page"), limit: int = Query(100, ge=1, le=1000)):
+    """List classifiers using keyset pagination on (name, uid)"""
+    try:
+        # Rows are plain property maps; hand them straight to orjson
+        return ORJSONResponse(
+            content=ClassifierService.list_classifiers(cursor=cursor, limit=limit),
+            headers={"X-Total-Count": str(ClassifierService.count_classifiers())}
+        )
+        
+    except Exception as e:
+        logger.error(f"Error listing classifiers: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error listing classifiers: {str(e)}")
+
+@app.get("/users")
+def list_users(cursor: Optional[str] = Query(None, description="next_cursor from the previous page"), limit: int = Query(100, ge=1, le=1000)):
+    """List users using keyset pagination on (displayName, uid)"""
+    try:
+        return ORJSONResponse(
+            content=UserService.list_users(cursor=cursor, limit=limit),
+            headers={"X-Total-Count": str(UserService.count_users())}
+        )
+        
+    except Exception as e:
+        logger.error(f"Error listing users: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error listing users: {str(e)}")
+
+@app.get("/sessions")
+def list_sessions(cursor: Optional[str] = Query(None, description="next_cursor from the previous page"), limit: int = Query(100, ge=1, le=1000)):
+    """List sessions newest first using keyset pagination on (createdAt, sessionId)"""
+    try:
+        return ORJSONResponse(
+            content=SessionService.list_sessions(cursor=cursor, limit=limit),
+            headers={"X-Total-Count": str(SessionService.count_sessions())}
+        )
+        
+    except Exception as e:
+        logger.error(f"Error listing sessions: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error listing sessions: {str(e)}")
+
+@app.post("/classifiers/batch")
+def create_classifiers(classifiers: List[ClassifierCreate]):
+    """Create many classifiers with one UNWIND statement per batch"""
+    try:
+        logger.info(f"Creating {len(classifiers)} classifiers")
+        
+        created = ClassifierService.create_classifiers(_CLASSIFIER_LIST_ADAPTER.dump_python(classifiers))
+        
+        return {"success": True, "message": "Classifiers created successfully", "created_count": created}
+        
+    except Exception as e:
+        logger.error(f"Error creating classifiers: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error creating classifiers: {str(e)}")
+
+@app.post("/documents/batch")
+def create_documents(documents: List[DocumentStructureIn]):
+    """Create many complete document structures with one UNWIND statement per batch"""
+    try:
+        logger.info(f"Creating {len(documents)} documents")
+        
+        created = DocumentService.create_document_structures(_DOCUMENT_LIST_ADAPTER.dump_python(documents))
+        
+        return {"success": True, "message": "Documents created successfully", "created_count": created}
+        
+    except Exception as e:
+        logger.error(f"Error creating documents: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error creating documents: {str(e)}")
+
+@app.post("/folders/batch")
+def create_folders(folders: List[FolderCreate]):
+    """Create many folders with one UNWIND statement per batch"""
+    try:
+        logger.info(f"Creating {len(folders)} folders")
+        
+        created = FolderService.create_folders(_FOLDER_LIST_ADAPTER.dump_python(folders))
+        
+        return {"success": True, "message": "Folders created successfully", "created_count": created}
+        
+    except Exception as e:
+        logger.error(f"Error creating folders: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error creating folders: {str(e)}")
+
+@app.post("/enrichers/batch")
+def create_enrichers(enrichers: List[EnricherCreate]):
+    """Create many enrichers with one UNWIND statement per batch"""
+    try:
+        logger.info(f"Creating {len(enrichers)} enrichers")
+        
+        created = EnricherService.create_enrichers(_ENRICHER_LIST_ADAPTER.dump_python(enrichers))
+        
+        return {"success": True, "message": "Enrichers created successfully", "created_count": created}
+        
+    except Exception as e:
+        logger.error(f"Error creating enrichers: {str(e)}")
+        raise HTTPException(status_code=_error_status(e), detail=f"Error creating enrichers: {str(e)}")
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop and httptools come with uvicorn[standard]
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "5000")),
+        loop="uvloop",
+        http="httptools",
+        # Read caches are per process and only invalidated by the worker that
+        # handled the write, so more workers trade freshness for throughput
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
@@ -10,7 +10,7 @@ class User(StructuredNode):
     """User node model"""
     uid = StringProperty(unique_index=True, required=True)
     email = StringProperty(required=True)
-    displayName = StringProperty(required=True)
+    displayName = StringProperty(required=True, index=True)
     
     # Relationships
     created_documents = RelationshipFrom('Document', 'CREATED_BY')
@@ -34,7 +34,7 @@ class Session(StructuredNode):
     """Session node model"""
     sessionId = StringProperty(unique_index=True, required=True)
     sessionName = StringProperty(required=True)
-    createdAt = StringProperty(required=True)
+    createdAt = StringProperty(required=True, index=True)
     createdBy = StringProperty(required=True)
     fileCount = IntegerProperty(required=True)
     completedAt = StringProperty()
@@ -80,13 +80,13 @@ class Document(StructuredNode):
     file_name = StringProperty()
     source = StringProperty(required=True)
     type = StringProperty(required=True)
-    createdDateTime = StringProperty(required=True)
+    createdDateTime = StringProperty(required=True, index=True)
     lastModifiedDateTime = StringProperty(required=True)
     webUrl = StringProperty(required=True)
     downloadUrl = StringProperty(required=True)
     driveId = StringProperty(required=True)
     siteId = StringProperty(required=True)
-    status = StringProperty(required=True)
+    status = StringProperty(required=True, index=True)
     description = StringProperty()
     version = StringProperty(required=True)
     
@@ -102,7 +102,7 @@ class Document(StructuredNode):
 class Classifier(StructuredNode):
     """Classifier node model"""
     uid = StringProperty(unique_index=True, required=True)
-    name = StringProperty(required=True)
+    name = StringProperty(required=True, index=True)
     isHierarchy = BooleanProperty(required=True)
     parentId = StringProperty()
     prompt = StringProperty(required=True)
@@ -0,0 +1,200 @@
+# Cypher statements used by the service layer
+#
+# Statements are built once at import so every call reuses the same query
+# text (and Neo4j's cached plan for it)
+
+# Fetches a document and its relations in a single round trip;
+# OPTIONAL MATCH keeps the document when a relation is missing
+GET_DOCUMENT_WITH_RELATIONS_QUERY = """
+    MATCH (d:Document {uid: $document_id})
+    OPTIONAL MATCH (d)-[:CREATED_BY]->(cb:User)
+    OPTIONAL MATCH (d)-[:LAST_MODIFIED_BY]->(mb:User)
+    OPTIONAL MATCH (d)-[:STORED_IN]->(f:Folder)
+    OPTIONAL MATCH (d)-[:HAS_METADATA]->(fm:FileMetadata)
+    OPTIONAL MATCH (d)-[:HAS_VERSION]->(v:Version)
+    RETURN d{.name, .source, .file_name, .size, .uid, .siteId, .driveId, .label, .type,
+             .downloadUrl, .createdDateTime, .lastModifiedDateTime, .webUrl, .status} AS document,
+           cb{.uid, .email, .displayName} AS created_by,
+           mb{.uid, .email, .displayName} AS last_modified_by,
+           f{.uid, .name, .path, .driveType, .driveId, .siteId} AS folder,
+           fm{.mimeType, .quickXorHash, .sharedScope, .createdDateTime, .lastModifiedDateTime} AS metadata,
+           v{.eTag, .cTag} AS version
+    LIMIT 1
+"""
+
+# Batch variant keyed by uid. Pattern comprehensions fetch each relation
+# per document, so one document's relations never multiply another's rows
+GET_DOCUMENTS_WITH_RELATIONS_QUERY = """
+    UNWIND $document_ids AS document_id
+    MATCH (d:Document {uid: document_id})
+    RETURN d.uid AS document_id,
+           d{.name, .source, .file_name, .size, .uid, .siteId, .driveId, .label, .type,
+             .downloadUrl, .createdDateTime, .lastModifiedDateTime, .webUrl, .status} AS document,
+           head([(d)-[:CREATED_BY]->(cb:User) | cb{.uid, .email, .displayName}]) AS created_by,
+           head([(d)-[:LAST_MODIFIED_BY]->(mb:User) | mb{.uid, .email, .displayName}]) AS last_modified_by,
+           head([(d)-[:STORED_IN]->(f:Folder) | f{.uid, .name, .path, .driveType, .driveId, .siteId}]) AS folder,
+           head([(d)-[:HAS_METADATA]->(fm:FileMetadata) |
+                 fm{.mimeType, .quickXorHash, .sharedScope, .createdDateTime, .lastModifiedDateTime}]) AS metadata,
+           head([(d)-[:HAS_VERSION]->(v:Version) | v{.eTag, .cTag}]) AS version
+"""
+
+# Creates one document per row together with its users, folder, session,
+# metadata and version. Shared nodes are merged on their unique keys, so
+# existing ones are reused; the document itself is created, so a duplicate
+# uid fails on its unique constraint
+_DOCUMENT_STRUCTURES_WRITE = """
+    UNWIND $rows AS row
+    MERGE (cb:User {uid: row.created_by.uid})
+      ON CREATE SET cb += row.created_by
+    MERGE (mb:User {uid: row.last_modified_by.uid})
+      ON CREATE SET mb += row.last_modified_by
+    MERGE (f:Folder {uid: row.folder.uid})
+      ON CREATE SET f += row.folder
+    MERGE (s:Session {sessionId: row.session.sessionId})
+      ON CREATE SET s += row.session
+    CREATE (d:Document)
+    SET d = row.document
+    MERGE (fm:FileMetadata {documentId: row.metadata.documentId})
+    SET fm += row.metadata
+    MERGE (v:Version {documentId: row.version.documentId})
+    SET v += row.version
+    MERGE (d)-[:CREATED_BY]->(cb)
+    MERGE (d)-[:LAST_MODIFIED_BY]->(mb)
+    MERGE (d)-[:STORED_IN]->(f)
+    MERGE (d)-[:HAS_METADATA]->(fm)
+    MERGE (d)-[:HAS_VERSION]->(v)
+    MERGE (d)-[:IN_SESSION]->(s)
+"""
+
+CREATE_DOCUMENT_STRUCTURES_QUERY = _DOCUMENT_STRUCTURES_WRITE + "    RETURN d\n"
+
+# Batch variant; only the number of documents created goes back over the wire
+BULK_CREATE_DOCUMENT_STRUCTURES_QUERY = _DOCUMENT_STRUCTURES_WRITE + "    RETURN count(d) AS created\n"
+
+GET_DOCUMENT_ETAG_QUERY = """
+    MATCH (d:Document {uid: $document_id})-[:HAS_VERSION]->(v:Version)
+    RETURN v.eTag AS etag
+    LIMIT 1
+"""
+
+# Deletes in committed batches so large graphs never need one huge transaction;
+# CALL ... IN TRANSACTIONS only runs in an auto-commit transaction
+DELETE_ALL_NODES_QUERY = """
+    MATCH (n)
+    CALL {
+        WITH n
+        DETACH DELETE n
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# Bulk creates assign each row map wholesale; rows come from the validated
+# request models, so only whitelisted fields reach the nodes
+CREATE_CLASSIFIERS_QUERY = """
+    UNWIND $rows AS row
+    CREATE (c:Classifier)
+    SET c = row
+    RETURN count(c) AS created
+"""
+
+CREATE_FOLDERS_QUERY = """
+    UNWIND $rows AS row
+    CREATE (f:Folder)
+    SET f = row
+    RETURN count(f) AS created
+"""
+
+CREATE_ENRICHERS_QUERY = """
+    UNWIND $rows AS row
+    CREATE (e:Enricher)
+    SET e = row
+    RETURN count(e) AS created
+"""
+
+# Keyset pagination: each listing has a first-page statement and one that
+# continues strictly after the (sort key, unique key) pair of the previous
+# page's last row, so rows sharing a sort key are never skipped. Both are
+# written so the sort key's range index serves the filter and the order
+# (a scan on IS NOT NULL, a range seek on the cursor), making a page cost
+# O(log N + limit) instead of a label scan. The sort keys are required
+# properties, so IS NOT NULL drops no rows; the hints pin the index plan
+# even on labels small enough that the planner would prefer a scan.
+LIST_CLASSIFIERS_QUERY = """
+    MATCH (c:Classifier)
+    USING INDEX c:Classifier(name)
+    WHERE c.name IS NOT NULL
+    RETURN c{.*} AS classifier
+    ORDER BY c.name, c.uid
+    LIMIT $limit
+"""
+
+LIST_CLASSIFIERS_AFTER_QUERY = """
+    MATCH (c:Classifier)
+    USING INDEX c:Classifier(name)
+    WHERE c.name >= $after_key AND (c.name > $after_key OR c.uid > $after_id)
+    RETURN c{.*} AS classifier
+    ORDER BY c.name, c.uid
+    LIMIT $limit
+"""
+
+LIST_USERS_QUERY = """
+    MATCH (u:User)
+    USING INDEX u:User(displayName)
+    WHERE u.displayName IS NOT NULL
+    RETURN u{.*} AS user
+    ORDER BY u.displayName, u.uid
+    LIMIT $limit
+"""
+
+LIST_USERS_AFTER_QUERY = """
+    MATCH (u:User)
+    USING INDEX u:User(displayName)
+    WHERE u.displayName >= $after_key AND (u.displayName > $after_key OR u.uid > $after_id)
+    RETURN u{.*} AS user
+    ORDER BY u.displayName, u.uid
+    LIMIT $limit
+"""
+
+# Newest sessions first, so the cursor moves backwards in time
+LIST_SESSIONS_QUERY = """
+    MATCH (s:Session)
+    USING INDEX s:Session(createdAt)
+    WHERE s.createdAt IS NOT NULL
+    RETURN s{.*} AS session
+    ORDER BY s.createdAt DESC, s.sessionId DESC
+    LIMIT $limit
+"""
+
+LIST_SESSIONS_AFTER_QUERY = """
+    MATCH (s:Session)
+    USING INDEX s:Session(createdAt)
+    WHERE s.createdAt <= $after_key AND (s.createdAt < $after_key OR s.sessionId < $after_id)
+    RETURN s{.*} AS session
+    ORDER BY s.createdAt DESC, s.sessionId DESC
+    LIMIT $limit
+"""
+
+# Label counts are answered from Neo4j's count store rather than a scan
+COUNT_CLASSIFIERS_QUERY = "MATCH (c:Classifier) RETURN count(c) AS total"
+COUNT_USERS_QUERY = "MATCH (u:User) RETURN count(u) AS total"
+COUNT_SESSIONS_QUERY = "MATCH (s:Session) RETURN count(s) AS total"
+
+# Hot statements and placeholder parameters used to warm the plan cache
+WARMUP_QUERIES = (
+    (GET_DOCUMENT_WITH_RELATIONS_QUERY, {"document_id": ""}),
+    (GET_DOCUMENTS_WITH_RELATIONS_QUERY, {"document_ids": []}),
+    (GET_DOCUMENT_ETAG_QUERY, {"document_id": ""}),
+    (LIST_CLASSIFIERS_QUERY, {"limit": 1}),
+    (LIST_CLASSIFIERS_AFTER_QUERY, {"after_key": "", "after_id": "", "limit": 1}),
+    (LIST_USERS_QUERY, {"limit": 1}),
+    (LIST_USERS_AFTER_QUERY, {"after_key": "", "after_id": "", "limit": 1}),
+    (LIST_SESSIONS_QUERY, {"limit": 1}),
+    (LIST_SESSIONS_AFTER_QUERY, {"after_key": "", "after_id": "", "limit": 1}),
+    (COUNT_CLASSIFIERS_QUERY, {}),
+    (COUNT_USERS_QUERY, {}),
+    (COUNT_SESSIONS_QUERY, {}),
+    (CREATE_DOCUMENT_STRUCTURES_QUERY, {"rows": []}),
+    (BULK_CREATE_DOCUMENT_STRUCTURES_QUERY, {"rows": []}),
+    (CREATE_CLASSIFIERS_QUERY, {"rows": []}),
+    (CREATE_FOLDERS_QUERY, {"rows": []}),
+    (CREATE_ENRICHERS_QUERY, {"rows": []}),
+)
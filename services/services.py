@@ -1,15 +1,345 @@
 from models.models import (
-    Document, User, Folder, Session, 
-    FileMetadata, Version, Classifier, 
+    Document, User, Session, Classifier, 
     ClassifierData, Enricher, BGSClassification, UserEdit
 )
+from neo4j.exceptions import TransientError
 from neomodel import db
+from services.queries import (
+    GET_DOCUMENT_WITH_RELATIONS_QUERY, GET_DOCUMENTS_WITH_RELATIONS_QUERY,
+    GET_DOCUMENT_ETAG_QUERY, DELETE_ALL_NODES_QUERY,
+    CREATE_DOCUMENT_STRUCTURES_QUERY, BULK_CREATE_DOCUMENT_STRUCTURES_QUERY,
+    CREATE_CLASSIFIERS_QUERY, CREATE_FOLDERS_QUERY, CREATE_ENRICHERS_QUERY,
+    LIST_CLASSIFIERS_QUERY, LIST_CLASSIFIERS_AFTER_QUERY,
+    LIST_USERS_QUERY, LIST_USERS_AFTER_QUERY,
+    LIST_SESSIONS_QUERY, LIST_SESSIONS_AFTER_QUERY,
+    COUNT_CLASSIFIERS_QUERY, COUNT_USERS_QUERY, COUNT_SESSIONS_QUERY
+)
+from cachetools import TTLCache
+from concurrent.futures import Future
+import base64
+import json
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, Tuple, FrozenSet
 
 logger = logging.getLogger(__name__)
 
 
+class _LockedTTLCache(TTLCache):
+    """TTLCache that can be shared by the endpoint threadpool
+    
+    Writers invalidate through invalidate()/invalidate_all(), which bump a
+    generation counter. Readers note the generation before fetching and
+    fill the cache with store(), which drops results fetched before an
+    invalidation.
+    """
+    
+    def __init__(self, maxsize, ttl):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+        self.generation = 0
+    
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+    
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+    
+    def pop(self, key, default=None):
+        with self._lock:
+            return super().pop(key, default)
+    
+    def clear(self):
+        with self._lock:
+            super().clear()
+    
+    def invalidate(self, key):
+        with self._lock:
+            self.generation += 1
+            super().pop(key, None)
+    
+    def invalidate_all(self):
+        with self._lock:
+            self.generation += 1
+            super().clear()
+    
+    def store(self, key, value, generation):
+        """Cache a value fetched at the given generation, unless invalidated since"""
+        with self._lock:
+            if generation == self.generation:
+                super().__setitem__(key, value)
+
+
+# In-flight reads, so concurrent identical requests share one query
+_INFLIGHT: Dict[Any, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _coalesce(key: Any, fetch):
+    """Run fetch once for all concurrent callers with the same key"""
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _INFLIGHT[key] = future
+    
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = fetch()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _encode_cursor(sort_value: Any, unique_value: Any) -> str:
+    """Pack the last row's sort and unique keys into an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps([sort_value, unique_value]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Unpack a cursor made by _encode_cursor"""
+    try:
+        sort_value, unique_value = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    return sort_value, unique_value
+
+
+def _keyset_page(first_query: str, after_query: str, sort_key: str, unique_key: str,
+                 cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """Fetch one keyset page; next_cursor points past the last row, if any remain"""
+    if cursor:
+        after_key, after_id = _decode_cursor(cursor)
+        results, _ = db.cypher_query(after_query, {"after_key": after_key, "after_id": after_id, "limit": limit})
+    else:
+        results, _ = db.cypher_query(first_query, {"limit": limit})
+    items = [row[0] for row in results]
+    return {
+        "items": items,
+        "next_cursor": _encode_cursor(items[-1][sort_key], items[-1][unique_key]) if len(items) == limit else None
+    }
+
+
+def _cached_count(query: str) -> int:
+    """Run a count statement, reusing the result for a short while"""
+    total = _COUNT_CACHE.get(query)
+    if total is None:
+        generation = _COUNT_CACHE.generation
+        results, _ = db.cypher_query(query)
+        total = results[0][0]
+        _COUNT_CACHE.store(query, total, generation)
+    return total
+
+
+def _etag_matches(etag: Optional[str], tags: FrozenSet[str]) -> bool:
+    """Whether a stored eTag matches any If-None-Match tag (weak comparison)"""
+    return bool(etag) and ("*" in tags or etag.strip('"') in tags)
+
+
+def _build_document_export(document, created_by, last_modified_by, folder, metadata, version) -> Dict[str, Any]:
+    """Shape one row of projected maps into the export response"""
+    (name, source, file_name, size, uid, site_id, drive_id, label, doc_type,
+     download_url, created, modified, web_url, status) = _DOCUMENT_FIELDS(document)
+    
+    # Build response structure
+    response = {
+        "name": name,
+        "source": source,
+        "file_name": file_name,
+        "lastModifiedDate": modified,
+        "size": size,
+        "id": uid,
+        "site_id": site_id,
+        "drive_id": drive_id,
+        "label": label,
+        "type": doc_type,
+        "@microsoft.graph.downloadUrl": download_url,
+        "createdDateTime": created,
+        "lastModifiedDateTime": modified,
+        "webUrl": web_url,
+        "status": status,
+        "createdBy": dict(zip(("id", "email", "displayName"), _USER_FIELDS(created_by)))
+        if created_by else None,
+        "lastModifiedBy": dict(zip(("id", "email", "displayName"), _USER_FIELDS(last_modified_by)))
+        if last_modified_by else None,
+        "parentReference": dict(zip(("id", "name", "path", "driveType", "driveId", "siteId"), _FOLDER_FIELDS(folder)))
+        if folder else None,
+        "file": None,
+        "fileSystemInfo": None,
+        "shared": None,
+        "cTag": None,
+        "eTag": None
+    }
+    
+    if metadata:
+        mime_type, quick_xor_hash, shared_scope, fm_created, fm_modified = _METADATA_FIELDS(metadata)
+        response["file"] = {"hashes": {"quickXorHash": quick_xor_hash}, "mimeType": mime_type}
+        response["fileSystemInfo"] = {"createdDateTime": fm_created, "lastModifiedDateTime": fm_modified}
+        response["shared"] = {"scope": shared_scope}
+    
+    if version:
+        response["eTag"], response["cTag"] = _VERSION_FIELDS(version)
+    
+    return response
+
+
+def _document_structure_row(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Group flat document data into one property map per node"""
+    return {
+        "created_by": {
+            "uid": data["createdBy_id"],
+            "email": data["createdBy_email"],
+            "displayName": data["createdBy_displayName"]
+        },
+        "last_modified_by": {
+            "uid": data["lastModifiedBy_id"],
+            "email": data["lastModifiedBy_email"],
+            "displayName": data["lastModifiedBy_displayName"]
+        },
+        "folder": {
+            "uid": data["parentReference_id"],
+            "name": data["parentReference_name"],
+            "path": data["parentReference_path"],
+            "driveType": data["parentReference_driveType"],
+            "driveId": data["parentReference_driveId"],
+            "siteId": data["parentReference_siteId"]
+        },
+        "session": {
+            "sessionId": data["sessionId"],
+            "sessionName": data["sessionName"],
+            "createdAt": data["session_createdAt"],
+            "createdBy": data["session_createdBy"],
+            "fileCount": data["session_fileCount"],
+            "completedAt": data["session_completedAt"],
+            "status": data["session_status"],
+            "warnings": data["session_warnings"],
+            "rowCount": data["session_rowCount"]
+        },
+        "document": {
+            "uid": data["id"],
+            "name": data["name"],
+            "label": data["label"],
+            "size": data["size"],
+            "file_name": data["file_name"],
+            "source": data["source"],
+            "type": data["type"],
+            "createdDateTime": data["createdDateTime"],
+            "lastModifiedDateTime": data["lastModifiedDateTime"],
+            "webUrl": data["webUrl"],
+            "downloadUrl": data["downloadUrl"],
+            "driveId": data["driveId"],
+            "siteId": data["siteId"],
+            "status": data["status"],
+            "description": data["description"],
+            "version": data["version"]
+        },
+        "metadata": {
+            "documentId": data["file_documentId"],
+            "mimeType": data["file_mimeType"],
+            "quickXorHash": data["file_quickXorHash"],
+            "sharedScope": data["file_sharedScope"],
+            "createdDateTime": data["file_createdDateTime"],
+            "lastModifiedDateTime": data["file_lastModifiedDateTime"]
+        },
+        "version": {
+            "documentId": data["version_documentId"],
+            "eTag": data["version_eTag"],
+            "cTag": data["version_cTag"],
+            "timestamp": data["version_timestamp"],
+            "versionNumber": data["version_versionNumber"]
+        }
+    }
+
+
+class BulkWriteError(Exception):
+    """A bulk write failed after some of its batches had already committed"""
+    
+    def __init__(self, message: str, created: int):
+        super().__init__(message)
+        self.created = created
+
+
+def _run_write(query: str, params: Dict[str, Any]):
+    """Run a write statement, retrying transient failures the server rolled back"""
+    for attempt in range(WRITE_RETRY_ATTEMPTS):
+        try:
+            return db.cypher_query(query, params)
+        except TransientError as e:
+            if not e.is_retryable() or attempt == WRITE_RETRY_ATTEMPTS - 1:
+                raise
+            logger.warning(f"Transient error on write, retrying: {str(e)}")
+            time.sleep(WRITE_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+
+
+def _bulk_write(query: str, rows: List[Dict[str, Any]]) -> int:
+    """Run an UNWIND $rows statement in fixed-size batches, summing its counts
+    
+    Batches are not atomic as a whole: each commits on its own, bounding
+    transaction memory, so a failure leaves earlier batches in place and is
+    raised as BulkWriteError carrying the committed count.
+    """
+    created = 0
+    for start in range(0, len(rows), BULK_WRITE_BATCH_SIZE):
+        try:
+            results, _ = _run_write(query, {"rows": rows[start:start + BULK_WRITE_BATCH_SIZE]})
+        except Exception as e:
+            raise BulkWriteError(f"{str(e)} ({created} rows were already committed)", created) from e
+        created += results[0][0]
+    return created
+
+
+# Classifiers are near-immutable reference data, so reads are memoized by ID
+_CLASSIFIER_CACHE: TTLCache = _LockedTTLCache(maxsize=1024, ttl=60)
+
+# Users and sessions change rarely once created, so reads are memoized by ID too
+_USER_CACHE: TTLCache = _LockedTTLCache(maxsize=10000, ttl=60)
+_SESSION_CACHE: TTLCache = _LockedTTLCache(maxsize=10000, ttl=60)
+
+# Exported document payloads, keyed by document ID
+_DOCUMENT_EXPORT_CACHE: TTLCache = _LockedTTLCache(maxsize=1024, ttl=300)
+
+# Total rows per list endpoint, keyed by count statement; totals may lag by up to 30s
+_COUNT_CACHE: TTLCache = _LockedTTLCache(maxsize=16, ttl=30)
+
+# Extract the projected fields of an export row in one C-level call each
+_DOCUMENT_FIELDS = itemgetter(
+    "name", "source", "file_name", "size", "uid", "siteId", "driveId", "label", "type",
+    "downloadUrl", "createdDateTime", "lastModifiedDateTime", "webUrl", "status"
+)
+_USER_FIELDS = itemgetter("uid", "email", "displayName")
+_FOLDER_FIELDS = itemgetter("uid", "name", "path", "driveType", "driveId", "siteId")
+_METADATA_FIELDS = itemgetter("mimeType", "quickXorHash", "sharedScope", "createdDateTime", "lastModifiedDateTime")
+_VERSION_FIELDS = itemgetter("eTag", "cTag")
+
+# Rows written per UNWIND statement (and per transaction) by bulk writes
+BULK_WRITE_BATCH_SIZE = 10000
+
+# Write statements are retried this many times in all on transient errors
+# (deadlocks, leader switches), backing off exponentially from the base delay
+WRITE_RETRY_ATTEMPTS = 3
+WRITE_RETRY_BACKOFF_SECONDS = 0.1
+
+
 class DocumentService:
     """Service layer for Document operations using OGM"""
     
@@ -17,97 +347,14 @@ class DocumentService:
     def create_complete_document_structure(data: Dict[str, Any]) -> Document:
         """Create a complete document structure with all related entities"""
         try:
-            # Create or get users
-            created_by = User.nodes.get_or_none(uid=data["createdBy_id"])
-            if not created_by:
-                created_by = User(
-                    uid=data["createdBy_id"],
-                    email=data["createdBy_email"],
-                    displayName=data["createdBy_displayName"]
-                ).save()
-            
-            last_modified_by = User.nodes.get_or_none(uid=data["lastModifiedBy_id"])
-            if not last_modified_by:
-                last_modified_by = User(
-                    uid=data["lastModifiedBy_id"],
-                    email=data["lastModifiedBy_email"],
-                    displayName=data["lastModifiedBy_displayName"]
-                ).save()
-            
-            # Create or get folder
-            folder = Folder.nodes.get_or_none(uid=data["parentReference_id"])
-            if not folder:
-                folder = Folder(
-                    uid=data["parentReference_id"],
-                    name=data["parentReference_name"],
-                    path=data["parentReference_path"],
-                    driveType=data["parentReference_driveType"],
-                    driveId=data["parentReference_driveId"],
-                    siteId=data["parentReference_siteId"]
-                ).save()
-            
-            # Create or get session
-            session = Session.nodes.get_or_none(sessionId=data["sessionId"])
-            if not session:
-                session = Session(
-                    sessionId=data["sessionId"],
-                    sessionName=data["sessionName"],
-                    createdAt=data["session_createdAt"],
-                    createdBy=data["session_createdBy"],
-                    fileCount=data["session_fileCount"],
-                    completedAt=data["session_completedAt"],
-                    status=data["session_status"],
-                    warnings=data["session_warnings"],
-                    rowCount=data["session_rowCount"]
-                ).save()
-            
-            # Create document
-            document = Document(
-                uid=data["id"],
-                name=data["name"],
-                label=data["label"],
-                size=data["size"],
-                file_name=data["file_name"],
-                source=data["source"],
-                type=data["type"],
-                createdDateTime=data["createdDateTime"],
-                lastModifiedDateTime=data["lastModifiedDateTime"],
-                webUrl=data["webUrl"],
-                downloadUrl=data["downloadUrl"],
-                driveId=data["driveId"],
-                siteId=data["siteId"],
-                status=data["status"],
-                description=data["description"],
-                version=data["version"]
-            ).save()
-            
-            # Create file metadata
-            file_metadata = FileMetadata(
-                documentId=data["file_documentId"],
-                mimeType=data["file_mimeType"],
-                quickXorHash=data["file_quickXorHash"],
-                sharedScope=data["file_sharedScope"],
-                createdDateTime=data["file_createdDateTime"],
-                lastModifiedDateTime=data["file_lastModifiedDateTime"]
-            ).save()
-            
-            # Create version
-            version = Version(
-                documentId=data["version_documentId"],
-                eTag=data["version_eTag"],
-                cTag=data["version_cTag"],
-                timestamp=data["version_timestamp"],
-                versionNumber=data["version_versionNumber"]
-            ).save()
-            
-            # Create relationships
-            document.created_by.connect(created_by)
-            document.last_modified_by.connect(last_modified_by)
-            document.stored_in.connect(folder)
-            document.metadata.connect(file_metadata)
-            document.version_info.connect(version)
-            document.session.connect(session)
+            # Every node and relationship is merged in one statement and one commit
+            results, _ = _run_write(
+                CREATE_DOCUMENT_STRUCTURES_QUERY,
+                {"rows": [_document_structure_row(data)]}
+            )
+            document = Document.inflate(results[0][0])
             
+            _DOCUMENT_EXPORT_CACHE.invalidate(document.uid)
             logger.info(f"Created complete document structure for: {data['id']}")
             return document
             
@@ -115,98 +362,132 @@ class DocumentService:
             logger.error(f"Error creating document structure: {str(e)}")
             raise
     
+    @staticmethod
+    def create_document_structures(documents_data: List[Dict[str, Any]]) -> int:
+        """Create many complete document structures with one UNWIND statement per batch"""
+        try:
+            # Invalidate up front; a failed batch can still leave earlier ones committed
+            for data in documents_data:
+                _DOCUMENT_EXPORT_CACHE.invalidate(data["id"])
+            
+            created = _bulk_write(
+                BULK_CREATE_DOCUMENT_STRUCTURES_QUERY,
+                [_document_structure_row(data) for data in documents_data]
+            )
+            logger.info(f"Created {created} document structures")
+            return created
+            
+        except Exception as e:
+            logger.error(f"Error creating document structures: {str(e)}")
+            raise
+    
     @staticmethod
     def get_document_with_relations(document_id: str) -> Optional[Dict[str, Any]]:
         """Get a document with all its related data"""
         try:
-            document = Document.nodes.get_or_none(uid=document_id)
-            if not document:
+            cached = _DOCUMENT_EXPORT_CACHE.get(document_id)
+            if cached:
+                return cached
+            
+            # Callers after an invalidation start a fresh fetch rather than
+            # joining one that may have read the old data
+            generation = _DOCUMENT_EXPORT_CACHE.generation
+            results, _ = _coalesce(
+                ("document_with_relations", document_id, generation),
+                lambda: db.cypher_query(GET_DOCUMENT_WITH_RELATIONS_QUERY, {"document_id": document_id})
+            )
+            if not results:
                 return None
             
-            # Get related entities using neomodel relationships
-            created_by = None
-            last_modified_by = None
-            folder = None
-            metadata = None
-            version = None
+            response = _build_document_export(*results[0])
+            _DOCUMENT_EXPORT_CACHE.store(document_id, response, generation)
+            return response
             
-            try:
-                created_by = document.created_by.single()
-                last_modified_by = document.last_modified_by.single()
-                folder = document.stored_in.single()
-                metadata = document.metadata.single()
-                version = document.version_info.single()
-            except Exception as e:
-                logger.warning(f"Error getting relationships: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error getting document {document_id}: {str(e)}")
+            raise
+    
+    @staticmethod
+    def get_documents_with_relations(document_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many documents with their related data, keyed by document ID
+        
+        Cached exports are reused and the rest are fetched in one statement;
+        IDs that do not exist are left out.
+        """
+        try:
+            responses = {}
+            missing = []
+            for document_id in dict.fromkeys(document_ids):
+                cached = _DOCUMENT_EXPORT_CACHE.get(document_id)
+                if cached:
+                    responses[document_id] = cached
+                else:
+                    missing.append(document_id)
             
-            # Build response structure
-            response = {
-                "name": document.name,
-                "source": document.source,
-                "file_name": document.file_name,
-                "lastModifiedDate": document.lastModifiedDateTime,
-                "size": document.size,
-                "id": document.uid,
-                "site_id": document.siteId,
-                "drive_id": document.driveId,
-                "label": document.label,
-                "type": document.type,
-                "@microsoft.graph.downloadUrl": document.downloadUrl,
-                "createdDateTime": document.createdDateTime,
-                "lastModifiedDateTime": document.lastModifiedDateTime,
-                "webUrl": document.webUrl,
-                "status": document.status,
-                "createdBy": {
-                    "id": created_by.uid,
-                    "email": created_by.email,
-                    "displayName": created_by.displayName
-                } if created_by else None,
-                "lastModifiedBy": {
-                    "id": last_modified_by.uid,
-                    "email": last_modified_by.email,
-                    "displayName": last_modified_by.displayName
-                } if last_modified_by else None,
-                "parentReference": {
-                    "id": folder.uid,
-                    "name": folder.name,
-                    "path": folder.path,
-                    "driveType": folder.driveType,
-                    "driveId": folder.driveId,
-                    "siteId": folder.siteId
-                } if folder else None,
-                "file": {
-                    "hashes": {"quickXorHash": metadata.quickXorHash},
-                    "mimeType": metadata.mimeType
-                } if metadata else None,
-                "fileSystemInfo": {
-                    "createdDateTime": metadata.createdDateTime,
-                    "lastModifiedDateTime": metadata.lastModifiedDateTime
-                } if metadata else None,
-                "shared": {
-                    "scope": metadata.sharedScope
-                } if metadata else None,
-                "cTag": version.cTag if version else None,
-                "eTag": version.eTag if version else None
-            }
+            if missing:
+                generation = _DOCUMENT_EXPORT_CACHE.generation
+                results, _ = db.cypher_query(GET_DOCUMENTS_WITH_RELATIONS_QUERY, {"document_ids": missing})
+                for document_id, *row in results:
+                    response = responses[document_id] = _build_document_export(*row)
+                    _DOCUMENT_EXPORT_CACHE.store(document_id, response, generation)
             
-            return response
+            return responses
             
         except Exception as e:
-            logger.error(f"Error getting document {document_id}: {str(e)}")
+            logger.error(f"Error getting documents {document_ids}: {str(e)}")
             raise
     
+    @staticmethod
+    def get_document_etag(document_id: str) -> Optional[str]:
+        """Get the eTag of a document's version without loading the document"""
+        cached = _DOCUMENT_EXPORT_CACHE.get(document_id)
+        if cached:
+            return cached["eTag"]
+        
+        results, _ = db.cypher_query(GET_DOCUMENT_ETAG_QUERY, {"document_id": document_id})
+        return results[0][0] if results else None
+    
+    @staticmethod
+    def get_document_export(document_id: str, if_none_match: FrozenSet[str] = frozenset()) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Get a document's eTag and, unless one of the if_none_match tags is current, its export
+        
+        if_none_match holds unquoted entity tags, or "*" to match any eTag.
+        Returns (eTag, None) when the caller's copy is current and (None, None)
+        when the document does not exist.
+        """
+        response = _DOCUMENT_EXPORT_CACHE.get(document_id)
+        if response:
+            etag = response["eTag"]
+            return etag, None if _etag_matches(etag, if_none_match) else response
+        
+        # The eTag check and the full export share one session and transaction
+        with db.read_transaction:
+            etag = DocumentService.get_document_etag(document_id)
+            if _etag_matches(etag, if_none_match):
+                return etag, None
+            
+            return etag, DocumentService.get_document_with_relations(document_id)
+    
     @staticmethod
     def delete_all_documents():
         """Delete all documents and related data"""
         try:
             # Delete all nodes using Cypher
-            db.cypher_query("MATCH (n) DETACH DELETE n")
+            db.cypher_query(DELETE_ALL_NODES_QUERY)
             
             logger.info("All documents and related data deleted")
             
         except Exception as e:
             logger.error(f"Error deleting all data: {str(e)}")
             raise
+        finally:
+            # Batches commit separately, so even a failed delete may have
+            # removed nodes the caches still hold
+            _DOCUMENT_EXPORT_CACHE.invalidate_all()
+            _CLASSIFIER_CACHE.invalidate_all()
+            _USER_CACHE.invalidate_all()
+            _SESSION_CACHE.invalidate_all()
+            _COUNT_CACHE.invalidate_all()
 
 
 class UserService:
@@ -215,12 +496,32 @@ class UserService:
     @staticmethod
     def create_user(user_data: Dict[str, Any]) -> User:
         """Create a new user"""
-        return User(**user_data).save()
+        user = User(**user_data).save()
+        _USER_CACHE.invalidate(user.uid)
+        return user
     
     @staticmethod
     def get_user(user_id: str) -> Optional[User]:
-        """Get user by ID"""
-        return User.nodes.get_or_none(uid=user_id)
+        """Get user by ID, served from the TTL cache when possible"""
+        cached = _USER_CACHE.get(user_id)
+        if cached is not None:
+            return cached
+        
+        generation = _USER_CACHE.generation
+        user = _coalesce(("user", user_id, generation), lambda: User.nodes.get_or_none(uid=user_id))
+        if user:
+            _USER_CACHE.store(user_id, user, generation)
+        return user
+    
+    @staticmethod
+    def list_users(cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """List users ordered by display name, one keyset page at a time"""
+        return _keyset_page(LIST_USERS_QUERY, LIST_USERS_AFTER_QUERY, "displayName", "uid", cursor, limit)
+    
+    @staticmethod
+    def count_users() -> int:
+        """Count all users, cached for a short while"""
+        return _cached_count(COUNT_USERS_QUERY)
 
 
 class SessionService:
@@ -229,12 +530,64 @@ class SessionService:
     @staticmethod
     def create_session(session_data: Dict[str, Any]) -> Session:
         """Create a new session"""
-        return Session(**session_data).save()
+        session = Session(**session_data).save()
+        _SESSION_CACHE.invalidate(session.sessionId)
+        return session
     
     @staticmethod
     def get_session(session_id: str) -> Optional[Session]:
-        """Get session by ID"""
-        return Session.nodes.get_or_none(sessionId=session_id)
+        """Get session by ID, served from the TTL cache when possible"""
+        cached = _SESSION_CACHE.get(session_id)
+        if cached is not None:
+            return cached
+        
+        generation = _SESSION_CACHE.generation
+        session = _coalesce(("session", session_id, generation), lambda: Session.nodes.get_or_none(sessionId=session_id))
+        if session:
+            _SESSION_CACHE.store(session_id, session, generation)
+        return session
+    
+    @staticmethod
+    def list_sessions(cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """List sessions newest first, one keyset page at a time"""
+        return _keyset_page(LIST_SESSIONS_QUERY, LIST_SESSIONS_AFTER_QUERY, "createdAt", "sessionId", cursor, limit)
+    
+    @staticmethod
+    def count_sessions() -> int:
+        """Count all sessions, cached for a short while"""
+        return _cached_count(COUNT_SESSIONS_QUERY)
+
+
+class FolderService:
+    """Service layer for Folder operations"""
+    
+    @staticmethod
+    def create_folders(folders_data: List[Dict[str, Any]]) -> int:
+        """Create many folders with one UNWIND statement per batch"""
+        try:
+            created = _bulk_write(CREATE_FOLDERS_QUERY, folders_data)
+            logger.info(f"Created {created} folders")
+            return created
+            
+        except Exception as e:
+            logger.error(f"Error creating folders: {str(e)}")
+            raise
+
+
+class EnricherService:
+    """Service layer for Enricher operations"""
+    
+    @staticmethod
+    def create_enrichers(enrichers_data: List[Dict[str, Any]]) -> int:
+        """Create many enrichers with one UNWIND statement per batch"""
+        try:
+            created = _bulk_write(CREATE_ENRICHERS_QUERY, enrichers_data)
+            logger.info(f"Created {created} enrichers")
+            return created
+            
+        except Exception as e:
+            logger.error(f"Error creating enrichers: {str(e)}")
+            raise
 
 
 class ClassifierService:
@@ -243,14 +596,52 @@ class ClassifierService:
     @staticmethod
     def create_classifier(classifier_data: Dict[str, Any]) -> Classifier:
         """Create a new classifier"""
-        return Classifier(**classifier_data).save()
+        classifier = Classifier(**classifier_data).save()
+        _CLASSIFIER_CACHE.invalidate(classifier.uid)
+        return classifier
+    
+    @staticmethod
+    def create_classifiers(classifiers_data: List[Dict[str, Any]]) -> int:
+        """Create many classifiers with one UNWIND statement per batch"""
+        try:
+            # Invalidate up front; a failed batch can still leave earlier ones committed
+            for classifier_data in classifiers_data:
+                _CLASSIFIER_CACHE.invalidate(classifier_data["uid"])
+            
+            created = _bulk_write(CREATE_CLASSIFIERS_QUERY, classifiers_data)
+            
+            logger.info(f"Created {created} classifiers")
+            return created
+            
+        except Exception as e:
+            logger.error(f"Error creating classifiers: {str(e)}")
+            raise
     
     @staticmethod
     def get_classifier(classifier_id: str) -> Optional[Classifier]:
-        """Get classifier by ID"""
-        return Classifier.nodes.get_or_none(uid=classifier_id)
+        """Get classifier by ID, served from the TTL cache when possible"""
+        cached = _CLASSIFIER_CACHE.get(classifier_id)
+        if cached is not None:
+            return cached
+        
+        generation = _CLASSIFIER_CACHE.generation
+        classifier = _coalesce(("classifier", classifier_id, generation), lambda: Classifier.nodes.get_or_none(uid=classifier_id))
+        if classifier:
+            _CLASSIFIER_CACHE.store(classifier_id, classifier, generation)
+        return classifier
     
     @staticmethod
     def get_all_classifiers() -> List[Classifier]:
         """Get all classifiers"""
-        return list(Classifier.nodes.all())
+        # NodeSet.all() already returns a list; avoid copying it again
+        return Classifier.nodes.all()
+    
+    @staticmethod
+    def list_classifiers(cursor: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """List classifiers ordered by name, one keyset page at a time"""
+        return _keyset_page(LIST_CLASSIFIERS_QUERY, LIST_CLASSIFIERS_AFTER_QUERY, "name", "uid", cursor, limit)
+    
+    @staticmethod
+    def count_classifiers() -> int:
+        """Count all classifiers, cached for a short while"""
+        return _cached_count(COUNT_CLASSIFIERS_QUERY)
@@ -50,8 +50,141 @@ def test_ogm_setup():
         traceback.print_exc()
         return False
 
+def test_cypher_relationship_types():
+    """Check that service Cypher names relationship types instead of filtering on type(r)"""
+    import re
+    from services import queries
+    
+    offenders = [
+        name for name, value in vars(queries).items()
+        if isinstance(value, str) and re.search(r"\btype\s*\(", value)
+    ]
+    assert not offenders, f"Statements filtering relationships with type(): {offenders}"
+    logger.info("✓ Cypher statements use explicit relationship types")
+
+def test_document_create_call():
+    """Check that a single document is created with one (query, params) call"""
+    from unittest import mock
+    from services import services
+    from services.queries import CREATE_DOCUMENT_STRUCTURES_QUERY
+    
+    class _Captured(Exception):
+        pass
+    
+    class _FlatData(dict):
+        """Answers every flat document key with the key itself"""
+        def __missing__(self, key):
+            return key
+    
+    with mock.patch.object(services.db, "cypher_query", side_effect=_Captured) as cypher_query:
+        try:
+            services.DocumentService.create_complete_document_structure(_FlatData())
+        except _Captured:
+            pass
+    
+    args, kwargs = cypher_query.call_args
+    assert args[0] == CREATE_DOCUMENT_STRUCTURES_QUERY
+    assert len(args) == 2 and not kwargs, f"Unexpected cypher_query arguments: {args[1:]} {kwargs}"
+    
+    rows = args[1]["rows"]
+    assert len(rows) == 1 and rows[0]["document"]["uid"] == "id"
+    logger.info("✓ Single document create sends one statement with its rows")
+
+class _Skipped(Exception):
+    """A check that cannot run here, raised when not under pytest"""
+
+def _skip(reason):
+    """Skip the current check under pytest, or report it from the script entry point"""
+    if "pytest" in sys.modules:
+        import pytest
+        pytest.skip(reason)
+    raise _Skipped(reason)
+
+def _live_connection():
+    """Return the shared Neo4j connection, skipping the check when Neo4j is unreachable"""
+    from neo4j.exceptions import ServiceUnavailable
+    
+    try:
+        # Importing the module connects, so an unreachable server fails here
+        from database.database import db_connection
+        db_connection.driver.verify_connectivity()
+    except ServiceUnavailable as e:
+        _skip(f"Neo4j is not reachable: {str(e)}")
+    return db_connection
+
+def _passes(check):
+    """Run an assert-based check from the script entry point"""
+    try:
+        check()
+        return True
+    except _Skipped as e:
+        logger.warning(f"⚠ {check.__name__} skipped: {str(e)}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ {check.__name__} failed: {e!r}")
+        return False
+
+def test_lookup_indexes():
+    """Check that key lookups plan as unique index seeks
+    
+    Needs a running Neo4j with the labels already installed (the app does this
+    on startup) and is skipped when none is reachable. Only reads schema and
+    runs lookups; nothing is written.
+    """
+    db_connection = _live_connection()
+    
+    lookups = (
+        ("Document", "uid"),
+        ("User", "uid"),
+        ("Folder", "uid"),
+        ("Session", "sessionId"),
+        ("FileMetadata", "documentId"),
+        ("Version", "documentId"),
+    )
+    
+    records = db_connection.driver.execute_query(
+        "SHOW CONSTRAINTS YIELD type, labelsOrTypes, properties "
+        "WHERE type CONTAINS 'UNIQUENESS' RETURN labelsOrTypes, properties"
+    ).records
+    constrained = {(record["labelsOrTypes"][0], record["properties"][0]) for record in records}
+    missing = [f"{label}.{key}" for label, key in lookups if (label, key) not in constrained]
+    assert not missing, f"Missing unique constraints: {missing}"
+    
+    for label, key in lookups:
+        summary = db_connection.driver.execute_query(
+            f"PROFILE MATCH (n:{label} {{{key}: $value}}) RETURN n", value="x"
+        ).summary
+        assert "NodeUniqueIndexSeek" in str(summary.profile), f"{label}.{key} lookup does not use its unique index"
+    
+    logger.info("✓ Key lookups use unique index seeks")
+
+def test_list_indexes():
+    """Check that keyset list pages use the sort key's index instead of a label scan
+    
+    Same requirements as test_lookup_indexes; only reads.
+    """
+    db_connection = _live_connection()
+    from services import queries
+    
+    after = {"after_key": "", "after_id": "", "limit": 1}
+    statements = (
+        ("LIST_CLASSIFIERS_QUERY", {"limit": 1}),
+        ("LIST_CLASSIFIERS_AFTER_QUERY", after),
+        ("LIST_USERS_QUERY", {"limit": 1}),
+        ("LIST_USERS_AFTER_QUERY", after),
+        ("LIST_SESSIONS_QUERY", {"limit": 1}),
+        ("LIST_SESSIONS_AFTER_QUERY", after),
+    )
+    for name, params in statements:
+        plan = str(db_connection.driver.execute_query(
+            f"PROFILE {getattr(queries, name)}", params
+        ).summary.profile)
+        assert "NodeByLabelScan" not in plan and "NodeIndex" in plan, f"{name} does not use its sort key index"
+    
+    logger.info("✓ List pages use sort key indexes")
+
 if __name__ == "__main__":
-    success = test_ogm_setup()
+    success = test_ogm_setup() and _passes(test_cypher_relationship_types) and _passes(test_document_create_call) and _passes(test_lookup_indexes) and _passes(test_list_indexes)
     if success:
         print("\n✅ OGM conversion successful! You can now run the FastAPI application.")
         print("To start the server, run: uvicorn main:app --reload")